@@ -46,7 +46,7 @@ class SymbolKind(object):
     TypeParameter = 26
 
 
-symbol_kinds = list(range(SymbolKind.File, SymbolKind.TypeParameter + 1))
+symbol_kinds = tuple(range(SymbolKind.File, SymbolKind.TypeParameter + 1))
 
 
 class CompletionItemKind(object):
@@ -77,7 +77,7 @@ class CompletionItemKind(object):
     TypeParameter = 25
 
 
-completion_item_kinds = list(range(CompletionItemKind.Text, CompletionItemKind.TypeParameter + 1))
+completion_item_kinds = tuple(range(CompletionItemKind.Text, CompletionItemKind.TypeParameter + 1))
 
 
 class DocumentHighlightKind(object):
@@ -21,9 +21,13 @@ TCP_CONNECT_TIMEOUT = 5
 # RequestDict = TypedDict('RequestDict', {'id': 'Union[str,int]', 'method': str, 'params': 'Optional[Any]'})
 
 
+# Shared encoder emitting compact json, avoids whitespace after separators in every message sent.
+_encoder = json.JSONEncoder(separators=(',', ':'))
+
+
 def format_request(payload: 'Dict[str, Any]') -> str:
     """Converts the request into json"""
-    return json.dumps(payload, sort_keys=False)
+    return _encoder.encode(payload)
 
 
 def attach_tcp_client(tcp_port: int, process: 'subprocess.Popen', settings: Settings) -> 'Optional[Client]':
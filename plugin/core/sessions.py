@@ -8,8 +8,7 @@ from .logging import debug
 import os
 from .protocol import completion_item_kinds, symbol_kinds
 try:
-    from typing import Callable, Dict, Any, Optional
-    assert Callable and Dict and Any and Optional
+    from typing import Callable, Dict, Any, Optional  # noqa: F401
 except ImportError:
     pass
 
@@ -17,37 +16,100 @@ except ImportError:
 def create_session(config: ClientConfig, project_path: str, env: dict, settings: Settings,
                    on_created=None, on_ended: 'Optional[Callable[[str], None]]' = None,
                    bootstrap_client=None) -> 'Optional[Session]':
-    session = None
     if config.binary_args:
-
-        process = start_server(config.binary_args, project_path, env, settings.log_stderr)
-        if process:
-            if config.tcp_port:
-                transport = start_tcp_transport(config.tcp_port, config.tcp_host)
-                if transport:
-                    session = Session(config, project_path, Client(transport, settings), on_created, on_ended)
-                else:
-                    # try to terminate the process
-                    try:
-                        process.terminate()
-                    except Exception:
-                        pass
-            else:
-                client = attach_stdio_client(process, settings)
-                session = Session(config, project_path, client, on_created, on_ended)
+        return _start_server_session(config, project_path, env, settings, on_created, on_ended)
+    elif config.tcp_port:
+        return _start_tcp_session(config, config.tcp_port, project_path, settings, on_created, on_ended)
+    elif bootstrap_client:
+        return Session(config, project_path, bootstrap_client, on_created, on_ended)
     else:
-        if config.tcp_port:
-            transport = start_tcp_transport(config.tcp_port, config.tcp_host)
-
-            session = Session(config, project_path, Client(transport, settings),
-                              on_created, on_ended)
-        elif bootstrap_client:
-            session = Session(config, project_path, bootstrap_client,
-                              on_created, on_ended)
-        else:
-            debug("No way to start session")
-
-    return session
+        debug("No way to start session")
+        return None
+
+
+def _start_server_session(config: ClientConfig, project_path: str, env: dict, settings: Settings,
+                          on_created, on_ended: 'Optional[Callable[[str], None]]') -> 'Optional[Session]':
+    process = start_server(config.binary_args, project_path, env, settings.log_stderr)
+    if not process:
+        return None
+
+    if config.tcp_port:
+        transport = start_tcp_transport(config.tcp_port, config.tcp_host)
+        if transport:
+            return Session(config, project_path, Client(transport, settings), on_created, on_ended)
+
+        # try to terminate the process
+        try:
+            process.terminate()
+        except Exception:
+            pass
+        return None
+
+    client = attach_stdio_client(process, settings)
+    return Session(config, project_path, client, on_created, on_ended)
+
+
+def _start_tcp_session(config: ClientConfig, tcp_port: int, project_path: str, settings: Settings,
+                       on_created, on_ended: 'Optional[Callable[[str], None]]') -> 'Session':
+    transport = start_tcp_transport(tcp_port, config.tcp_host)
+    return Session(config, project_path, Client(transport, settings), on_created, on_ended)
+
+
+# The client capabilities never change between sessions, so they are built once and shared.
+_client_capabilities = {
+    "textDocument": {
+        "synchronization": {
+            "didSave": True
+        },
+        "hover": {
+            "contentFormat": ["markdown", "plaintext"]
+        },
+        "completion": {
+            "completionItem": {
+                "snippetSupport": True
+            },
+            "completionItemKind": {
+                "valueSet": completion_item_kinds
+            }
+        },
+        "signatureHelp": {
+            "signatureInformation": {
+                "documentationFormat": ["markdown", "plaintext"],
+                "parameterInformation": {
+                    "labelOffsetSupport": True
+                }
+            }
+        },
+        "references": {},
+        "documentHighlight": {},
+        "documentSymbol": {
+            "symbolKind": {
+                "valueSet": symbol_kinds
+            }
+        },
+        "formatting": {},
+        "rangeFormatting": {},
+        "definition": {},
+        "codeAction": {
+            "codeActionLiteralSupport": {
+                "codeActionKind": {
+                    "valueSet": []
+                }
+            }
+        },
+        "rename": {}
+    },
+    "workspace": {
+        "applyEdit": True,
+        "didChangeConfiguration": {},
+        "executeCommand": {},
+        "symbol": {
+            "symbolKind": {
+                "valueSet": symbol_kinds
+            }
+        }
+    }
+}  # type: Dict[str, Any]
 
 
 def get_initialize_params(project_path: str, config: ClientConfig):
@@ -55,60 +117,7 @@ def get_initialize_params(project_path: str, config: ClientConfig):
         "processId": os.getpid(),
         "rootUri": filename_to_uri(project_path),
         "rootPath": project_path,
-        "capabilities": {
-            "textDocument": {
-                "synchronization": {
-                    "didSave": True
-                },
-                "hover": {
-                    "contentFormat": ["markdown", "plaintext"]
-                },
-                "completion": {
-                    "completionItem": {
-                        "snippetSupport": True
-                    },
-                    "completionItemKind": {
-                        "valueSet": completion_item_kinds
-                    }
-                },
-                "signatureHelp": {
-                    "signatureInformation": {
-                        "documentationFormat": ["markdown", "plaintext"],
-                        "parameterInformation": {
-                            "labelOffsetSupport": True
-                        }
-                    }
-                },
-                "references": {},
-                "documentHighlight": {},
-                "documentSymbol": {
-                    "symbolKind": {
-                        "valueSet": symbol_kinds
-                    }
-                },
-                "formatting": {},
-                "rangeFormatting": {},
-                "definition": {},
-                "codeAction": {
-                    "codeActionLiteralSupport": {
-                        "codeActionKind": {
-                            "valueSet": []
-                        }
-                    }
-                },
-                "rename": {}
-            },
-            "workspace": {
-                "applyEdit": True,
-                "didChangeConfiguration": {},
-                "executeCommand": {},
-                "symbol": {
-                    "symbolKind": {
-                        "valueSet": symbol_kinds
-                    }
-                }
-            }
-        }
+        "capabilities": _client_capabilities
     }
     if config.init_options:
         initializeParams['initializationOptions'] = config.init_options
@@ -117,6 +126,9 @@ def get_initialize_params(project_path: str, config: ClientConfig):
 
 
 class Session(object):
+    __slots__ = ('config', 'project_path', 'state', '_on_created', '_on_ended', 'capabilities',
+                 '_capability_flags', 'client')
+
     def __init__(self, config: ClientConfig, project_path, client: Client,
                  on_created=None, on_ended: 'Optional[Callable[[str], None]]' = None) -> None:
         self.config = config
@@ -124,12 +136,13 @@ class Session(object):
         self.state = ClientStates.STARTING
         self._on_created = on_created
         self._on_ended = on_ended
-        self.capabilities = dict()  # type: Dict[str, Any]
+        self.capabilities = {}  # type: Dict[str, Any]
+        self._capability_flags = {}  # type: Dict[str, bool]
         self.client = client
         self.initialize()
 
     def has_capability(self, capability):
-        return capability in self.capabilities and self.capabilities[capability] is not False
+        return self._capability_flags.get(capability, False)
 
     def get_capability(self, capability):
         return self.capabilities.get(capability)
@@ -142,7 +155,10 @@ class Session(object):
 
     def _handle_initialize_result(self, result):
         self.state = ClientStates.READY
-        self.capabilities = result.get('capabilities', dict())
+        self.capabilities = result.get('capabilities', {})
+        self._capability_flags = {
+            capability: value is not False for capability, value in self.capabilities.items()
+        }
         if self._on_created:
             self._on_created(self)
 
@@ -156,6 +172,7 @@ class Session(object):
     def _handle_shutdown_result(self):
         self.client.exit()
         self.client = None
-        self.capabilities = dict()
+        self.capabilities = {}
+        self._capability_flags = {}
         if self._on_ended:
             self._on_ended(self.config.name)
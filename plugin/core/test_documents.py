@@ -45,7 +45,7 @@ class WindowDocumentHandlerTests(unittest.TestCase):
         self.assertEqual(document.get("languageId"), "test")
         self.assertEqual(document.get("text"), "asdf")
         self.assertEqual(document.get("version"), 0)
-        self.assertEqual(view._status.get("lsp_clients"), "test")
+        self.assertEqual(view.get_status("lsp_clients"), "test")
 
         # change 1
         view._text = "asdf jklm"
@@ -133,7 +133,7 @@ class WindowDocumentHandlerTests(unittest.TestCase):
         self.assertEqual(document2.get("languageId"), "test")
         self.assertEqual(document2.get("text"), "asdf")
         self.assertEqual(document2.get("version"), 0)
-        status_string = view._status.get("lsp_clients")
+        status_string = view.get_status("lsp_clients")
         if status_string:
             status_configs = status_string.split(", ")
             self.assertIn("test", status_configs)
@@ -69,6 +69,7 @@ class FormatTests(unittest.TestCase):
 
     def test_converts_payload_to_string(self):
         self.assertEqual("{}", format_request(dict()))
+        self.assertEqual('{"id":1,"params":[1,2]}', format_request({"id": 1, "params": [1, 2]}))
 
 
 class ClientTest(unittest.TestCase):
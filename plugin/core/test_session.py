@@ -1,13 +1,15 @@
 from .types import ClientConfig, LanguageConfig, ClientStates, Settings
-from .sessions import create_session, Session
+from .sessions import create_session, get_initialize_params, Session  # noqa: F401
 from .protocol import Request, Notification
+from .rpc import format_request
 from .logging import debug
 
+from collections import deque
+import json
 import unittest
 import unittest.mock
 try:
-    from typing import Any, List, Dict, Tuple, Callable, Optional
-    assert Any and List and Dict and Tuple and Callable and Optional and Session
+    from typing import Any, List, Dict, Tuple, Callable, Optional, Deque  # noqa: F401
 except ImportError:
     pass
 
@@ -34,7 +36,7 @@ basic_responses = {
 class MockClient():
     def __init__(self, async_response=None) -> None:
         self.responses = basic_responses
-        self._notifications = []  # type: List[Notification]
+        self._notifications = deque(maxlen=256)  # type: Deque[Notification]
         self._async_response_callback = async_response
 
     def send_request(self, request: Request, on_success: 'Callable', on_error: 'Callable' = None) -> None:
@@ -66,6 +68,7 @@ class MockClient():
 
 test_language = LanguageConfig("test", ["source.test"], ["Plain Text"])
 test_config = ClientConfig("test", [], None, languages=[test_language])
+test_settings = Settings()
 
 
 class SessionTest(unittest.TestCase):
@@ -80,7 +83,7 @@ class SessionTest(unittest.TestCase):
         config = ClientConfig("test", ["ls"], None, [test_language])
         project_path = "/"
         session = self.assert_if_none(
-            create_session(config, project_path, dict(), Settings()))
+            create_session(config, project_path, dict(), test_settings))
 
         self.assertEqual(session.state, ClientStates.STARTING)
         self.assertEqual(session.project_path, project_path)
@@ -90,9 +93,19 @@ class SessionTest(unittest.TestCase):
     def test_can_get_started_session(self):
         project_path = "/"
         created_callback = unittest.mock.Mock()
+        client = MockClient()
+        client.responses = {
+            'initialize': {
+                'capabilities': {
+                    'testing': True,
+                    'hoverProvider': None,
+                    'referencesProvider': False
+                }
+            }
+        }
         session = self.assert_if_none(
-            create_session(test_config, project_path, dict(), Settings(),
-                           bootstrap_client=MockClient(),
+            create_session(test_config, project_path, dict(), test_settings,
+                           bootstrap_client=client,
                            on_created=created_callback))
 
         self.assertEqual(session.state, ClientStates.READY)
@@ -100,6 +113,10 @@ class SessionTest(unittest.TestCase):
         self.assertEqual(session.project_path, project_path)
         self.assertTrue(session.has_capability("testing"))
         self.assertTrue(session.get_capability("testing"))
+        # a null capability still counts as present, only an explicit false or a missing key disables it.
+        self.assertTrue(session.has_capability("hoverProvider"))
+        self.assertFalse(session.has_capability("referencesProvider"))
+        self.assertFalse(session.has_capability("renameProvider"))
         created_callback.assert_called_once()
 
     def test_can_shutdown_session(self):
@@ -107,7 +124,7 @@ class SessionTest(unittest.TestCase):
         created_callback = unittest.mock.Mock()
         ended_callback = unittest.mock.Mock()
         session = self.assert_if_none(
-            create_session(test_config, project_path, dict(), Settings(),
+            create_session(test_config, project_path, dict(), test_settings,
                            bootstrap_client=MockClient(),
                            on_created=created_callback,
                            on_ended=ended_callback))
@@ -125,3 +142,22 @@ class SessionTest(unittest.TestCase):
         self.assertFalse(session.has_capability("testing"))
         self.assertIsNone(session.get_capability("testing"))
         ended_callback.assert_called_once()
+
+    def test_initialize_params_share_client_capabilities(self):
+        config = ClientConfig("test", [], None, languages=[test_language], init_options={"foo": "bar"})
+        params = get_initialize_params("/", config)
+        other_params = get_initialize_params("/", test_config)
+
+        self.assertEqual(params["rootPath"], "/")
+        self.assertEqual(params["initializationOptions"], {"foo": "bar"})
+        self.assertNotIn("initializationOptions", other_params)
+        self.assertIs(params["capabilities"], other_params["capabilities"])
+
+        # the payload sent to the server must not change with the shared capabilities
+        capabilities = json.loads(format_request(params))["capabilities"]
+        text_document = capabilities["textDocument"]
+        self.assertEqual(text_document["completion"]["completionItemKind"]["valueSet"], list(range(1, 26)))
+        self.assertEqual(text_document["documentSymbol"]["symbolKind"]["valueSet"], list(range(1, 27)))
+        self.assertEqual(capabilities["workspace"]["symbol"]["symbolKind"]["valueSet"], list(range(1, 27)))
+        self.assertEqual(text_document["hover"]["contentFormat"], ["markdown", "plaintext"])
+        self.assertTrue(capabilities["workspace"]["applyEdit"])
@@ -34,6 +34,8 @@ def _run_timeout():
 
 
 class Region(object):
+    __slots__ = ('a', 'b')
+
     def __init__(self, a, b):
         self.a = a
         self.b = b
@@ -1,25 +1,26 @@
-from .windows import WindowManager, WindowRegistry, ViewLike
+from .windows import WindowManager, WindowRegistry, ViewLike, extract_message
 from .diagnostics import WindowDiagnostics
-from .sessions import create_session, Session
+from .sessions import create_session, Session  # noqa: F401
 from .test_session import MockClient, test_config, test_language
 from .test_rpc import MockSettings
 from .events import global_events
-from .types import ClientConfig, LanguageConfig
+from .types import ClientConfig, LanguageConfig  # noqa: F401
 from . import test_sublime as test_sublime
 # from .logging import set_debug_logging, debug
 import os
 import tempfile
+import threading
 import unittest
 
 try:
-    from typing import Callable, List, Optional, Set, Dict, Any, Tuple
-    assert Callable and List and Optional and Set and Session and Dict and Any and Tuple
-    assert ClientConfig and LanguageConfig
+    from typing import Callable, List, Optional, Set, Dict, Any, Tuple  # noqa: F401
 except ImportError:
     pass
 
 
 class MockSublimeSettings(object):
+    __slots__ = ('_values',)
+
     def __init__(self, values):
         self._values = values
 
@@ -31,11 +32,13 @@ class MockSublimeSettings(object):
 
 
 class MockView(object):
+    __slots__ = ('_file_name', '_window', '_settings', '_status', '_text')
+
     def __init__(self, file_name):
         self._file_name = file_name
         self._window = None
         self._settings = MockSublimeSettings({"syntax": "Plain Text"})
-        self._status = dict()  # type: Dict[str, str]
+        self._status = None  # type: Optional[Dict[str, str]]
         self._text = "asdf"
 
     def file_name(self):
@@ -45,8 +48,13 @@ class MockView(object):
         self._window = window
 
     def set_status(self, key, status):
+        if self._status is None:
+            self._status = {}
         self._status[key] = status
 
+    def get_status(self, key):
+        return self._status.get(key, "") if self._status else ""
+
     def window(self):
         return self._window
 
@@ -69,6 +77,10 @@ class MockView(object):
         return 1
 
 
+# shown by every MockWindow for its empty groups, tests should not modify it.
+_empty_group_view = MockView(None)
+
+
 class MockHandlerDispatcher(object):
     def __init__(self, can_start: bool = True) -> None:
         self._can_start = can_start
@@ -82,11 +94,18 @@ class MockHandlerDispatcher(object):
 
 
 class MockWindow(object):
+    __slots__ = ('_views', '_group_offsets', '_is_valid', '_folders', '_default_view', '_project_data', 'commands')
+
     def __init__(self, files_in_groups: 'List[List[ViewLike]]' = []) -> None:
-        self._files_in_groups = files_in_groups
+        # views of all groups are stored back to back, group i owns _views[_group_offsets[i]:_group_offsets[i + 1]]
+        self._views = []  # type: List[ViewLike]
+        self._group_offsets = [0]  # type: List[int]
+        for views_in_group in files_in_groups:
+            self._views.extend(views_in_group)
+            self._group_offsets.append(len(self._views))
         self._is_valid = True
         self._folders = [os.path.dirname(__file__)]
-        self._default_view = MockView(None)
+        self._default_view = _empty_group_view
         self._project_data = None  # type: Optional[Dict[str, Any]]
         self.commands = []  # type: List[Tuple[str, Dict[str, Any]]]
 
@@ -100,7 +119,7 @@ class MockWindow(object):
         self._folders = folders
 
     def num_groups(self):
-        return len(self._files_in_groups)
+        return len(self._group_offsets) - 1
 
     def active_group(self):
         return 0
@@ -126,28 +145,26 @@ class MockWindow(object):
         }
 
     def active_view_in_group(self, group):
-        if group < len(self._files_in_groups):
-            files = self._files_in_groups[group]
-            if len(files) > 0:
-                return files[0]
+        if group < self.num_groups():
+            start = self._group_offsets[group]
+            if start < self._group_offsets[group + 1]:
+                return self._views[start]
             else:
                 return self._default_view
 
     def add_view_in_group(self, group, view):
-        self._files_in_groups[group].append(view)
+        self._views.insert(self._group_offsets[group + 1], view)
+        for index in range(group + 1, len(self._group_offsets)):
+            self._group_offsets[index] += 1
 
     def status_message(self, msg: str) -> None:
         pass
 
     def views(self):
-        views = []
-        for views_in_group in self._files_in_groups:
-            if len(views_in_group) < 1:
-                views.append(self._default_view)
-            else:
-                for view in views_in_group:
-                    views.append(view)
-        return views
+        offsets = self._group_offsets
+        return [view
+                for start, end in zip(offsets, offsets[1:])
+                for view in (self._views[start:end] or [self._default_view])]
 
     def run_command(self, command_name: str, command_args: 'Dict[str, Any]') -> None:
         self.commands.append((command_name, command_args))
@@ -195,6 +212,18 @@ class MockConfigs(object):
         pass
 
 
+class MockMultipleConfigs(MockConfigs):
+    def __init__(self, configs: 'List[ClientConfig]') -> None:
+        self.all = configs
+        self.disabled = []  # type: List[Tuple[str, threading.Thread]]
+
+    def syntax_configs(self, view):
+        return self.all
+
+    def disable(self, config_name: str) -> None:
+        self.disabled.append((config_name, threading.current_thread()))
+
+
 class MockDocuments(object):
     def __init__(self):
         self._documents = []  # type: List[str]
@@ -258,6 +287,11 @@ class WindowRegistryTests(unittest.TestCase):
 
 class WindowManagerTests(unittest.TestCase):
 
+    def test_extracts_log_message(self):
+        self.assertEqual(extract_message({"message": "hello"}), "hello")
+        self.assertEqual(extract_message({}), "???")
+        self.assertEqual(extract_message(None), "???")
+
     def test_can_start_active_views(self):
         docs = MockDocuments()
         wm = WindowManager(MockWindow([[MockView(__file__)]]), MockConfigs(), docs,
@@ -268,6 +302,53 @@ class WindowManagerTests(unittest.TestCase):
         self.assertIsNotNone(wm.get_session(test_config.name))
         self.assertListEqual(docs._documents, [__file__])
 
+    def test_starts_sessions_concurrently(self):
+        docs = MockDocuments()
+        configs = [ClientConfig(name, [], None, languages=[test_language]) for name in ("a", "b", "c", "d")]
+        all_starting = threading.Barrier(len(configs), timeout=5)
+
+        def start_session(window, project_path, config, on_created, on_ended):
+            # only passes once every session is being started at the same time.
+            all_starting.wait()
+            return create_session(config, project_path, dict(), MockSettings(),
+                                  bootstrap_client=MockClient(),
+                                  on_created=on_created,
+                                  on_ended=on_ended)
+
+        wm = WindowManager(MockWindow([[MockView(__file__)]]), MockMultipleConfigs(configs), docs,
+                           WindowDiagnostics(), start_session, test_sublime, MockHandlerDispatcher())
+        wm.start_active_views()
+
+        for config in configs:
+            self.assertIsNotNone(wm.get_session(config.name))
+        self.assertEqual(len(docs._sessions), len(configs))
+
+    def test_concurrent_start_failure_disables_only_failing_config(self):
+        docs = MockDocuments()
+        configs = [ClientConfig(name, [], None, languages=[test_language]) for name in ("a", "b", "c", "d")]
+        mock_configs = MockMultipleConfigs(configs)
+        all_starting = threading.Barrier(len(configs), timeout=5)
+
+        def start_session(window, project_path, config, on_created, on_ended):
+            all_starting.wait()
+            if config.name == "b":
+                raise Exception("b failed to start")
+            return create_session(config, project_path, dict(), MockSettings(),
+                                  bootstrap_client=MockClient(),
+                                  on_created=on_created,
+                                  on_ended=on_ended)
+
+        wm = WindowManager(MockWindow([[MockView(__file__)]]), mock_configs, docs,
+                           WindowDiagnostics(), start_session, test_sublime, MockHandlerDispatcher())
+        wm.start_active_views()
+
+        self.assertIsNone(wm.get_session("b"))
+        for name in ("a", "c", "d"):
+            self.assertIsNotNone(wm.get_session(name))
+
+        # the failure is reported from the thread that requested the start, not from a pool worker.
+        self.assertEqual(mock_configs.disabled, [("b", threading.current_thread())])
+
     def test_can_open_supported_view(self):
         docs = MockDocuments()
         window = MockWindow([[]])
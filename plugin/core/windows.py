@@ -8,17 +8,21 @@ from .sessions import Session
 from .url import filename_to_uri
 from .workspace import get_project_path
 from .rpc import Client
+from concurrent.futures import ThreadPoolExecutor
 try:
     from typing_extensions import Protocol
-    from typing import Optional, List, Callable, Dict, Any
+    from typing import Optional, List, Callable, Dict, Any, Tuple
     from types import ModuleType
-    assert Optional and List and Callable and Dict and Session and Any and ModuleType
+    assert Optional and List and Callable and Dict and Session and Any and ModuleType and Tuple
     assert LanguageConfig
 except ImportError:
     pass
     Protocol = object  # type: ignore
 
 
+MAX_CONCURRENT_STARTS = 8
+
+
 class ConfigRegistry(Protocol):
     # todo: calls config_for_scope immediately.
     all = []  # type: List[ClientConfig]
@@ -77,6 +81,10 @@ def get_active_views(window: WindowLike):
     return views
 
 
+def extract_message(params: 'Any') -> str:
+    return (params or {}).get("message", "???")
+
+
 class DocumentState:
     """Stores version count for documents open in a language service"""
     def __init__(self, path: str) -> 'None':
@@ -359,50 +367,96 @@ class WindowManager(object):
 
     def _initialize_on_open(self, view: ViewLike):
         # have all sessions for this document been started?
-        startable_configs = filter(lambda c: c.enabled and c.name not in self._sessions,
-                                   self._configs.syntax_configs(view))
+        startable_configs = list(filter(lambda c: c.enabled and c.name not in self._sessions,
+                                        self._configs.syntax_configs(view)))
 
         for config in startable_configs:
             debug("window {} requests {} for {}".format(self._window.id(), config.name, view.file_name()))
-            self._start_client(config)
+
+        if len(startable_configs) > 1:
+            self._start_clients(startable_configs)
+        else:
+            for config in startable_configs:
+                self._start_client(config)
 
     def _start_client(self, config: ClientConfig):
+        project_path = self._prepare_start(config)
+        if project_path is None:
+            return
+
+        try:
+            session = self._launch_session(config, project_path)
+        except Exception as e:
+            self._handle_start_failure(config, e)
+            return
+
+        self._add_session(config, session)
+
+    def _start_clients(self, configs: 'List[ClientConfig]'):
+        # only the server launches run on worker threads, as starting a server mostly waits on process spawn or
+        # socket connect. Checks, handler hooks, dialogs and session bookkeeping stay on the calling thread.
+        launches = []  # type: List[Tuple[ClientConfig, str]]
+        for config in configs:
+            project_path = self._prepare_start(config)
+            if project_path is not None:
+                launches.append((config, project_path))
+
+        if not launches:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_STARTS, len(launches))) as executor:
+            futures = [(config, executor.submit(self._launch_session, config, project_path))
+                       for config, project_path in launches]
+
+        for config, future in futures:
+            try:
+                session = future.result()
+            except Exception as e:
+                self._handle_start_failure(config, e)
+                continue
+
+            self._add_session(config, session)
+
+    def _prepare_start(self, config: ClientConfig) -> 'Optional[str]':
         project_path = get_project_path(self._window)
         if project_path is None:
             debug('Cannot start without a project folder')
-            return
+            return None
 
         if not self._can_start_config(config.name):
             debug('Already starting on this window:', config.name)
-            return
+            return None
 
         if not self._handlers.on_start(config.name, self._window):
-            return
+            return None
 
         self._window.status_message("Starting " + config.name + "...")
         debug("starting in", project_path)
-        session = None  # type: Optional[Session]
-        try:
-            session = self._start_session(self._window, project_path, config,
-                                          lambda session: self._handle_session_started(session, project_path, config),
-                                          lambda config_name: self._handle_session_ended(config_name))
-        except Exception as e:
-            message = "\n\n".join([
-                "Could not start {}",
-                "{}",
-                "Server will be disabled for this window"
-            ]).format(config.name, str(e))
+        return project_path
+
+    def _launch_session(self, config: ClientConfig, project_path: str) -> 'Optional[Session]':
+        return self._start_session(self._window, project_path, config,
+                                   lambda session: self._handle_session_started(session, project_path, config),
+                                   lambda config_name: self._handle_session_ended(config_name))
+
+    def _handle_start_failure(self, config: ClientConfig, error: Exception) -> None:
+        message = "\n\n".join([
+            "Could not start {}",
+            "{}",
+            "Server will be disabled for this window"
+        ]).format(config.name, str(error))
 
-            self._configs.disable(config.name)
-            self._sublime.message_dialog(message)
+        self._configs.disable(config.name)
+        self._sublime.message_dialog(message)
 
+    def _add_session(self, config: ClientConfig, session: 'Optional[Session]') -> None:
         if session:
             debug("window {} added session {}".format(self._window.id(), config.name))
             self._sessions[config.name] = session
 
     def _handle_message_request(self, params: dict, client: Client, request_id: int) -> None:
         actions = params.get("actions", [])
-        titles = list(action.get("title") for action in actions)
+        titles = [action.get("title") for action in actions]
 
         def send_user_choice(index):
             # when noop; nothing was selected e.g. the user pressed escape
@@ -471,7 +525,7 @@ class WindowManager(object):
 
         client.on_notification(
             "window/logMessage",
-            lambda params: server_log(config.name, params.get("message", "???") if params else "???"))
+            lambda params: server_log(config.name, extract_message(params)))
 
         self._handlers.on_initialized(config.name, self._window, client)
 